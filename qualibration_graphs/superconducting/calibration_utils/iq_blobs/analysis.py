@@ -105,34 +105,38 @@ def fit_raw_data(ds: xr.Dataset, node: QualibrationNode) -> Tuple[xr.Dataset, di
 
     # Get the blobs histogram along the rotated axis
     hist = [np.histogram(ds_fit.Ig_rot.sel(qubit=q.name), bins=100) for q in node.namespace["qubits"]]
-    # Get the discriminating threshold along the rotated axis
-    rus_threshold = [
-        hist[ii][1][1:][np.argmax(np.histogram(ds_fit.Ig_rot.sel(qubit=q.name), bins=100)[0])]
-        for ii, q in enumerate(node.namespace["qubits"])
-    ]
+    # Get the discriminating threshold along the rotated axis, reusing the histograms computed above
+    rus_threshold = [bin_edges[1:][np.argmax(counts)] for counts, bin_edges in hist]
     ds_fit = ds_fit.assign({"rus_threshold": xr.DataArray(rus_threshold, coords=dict(qubit=ds_fit.qubit.data))})
 
     threshold = []
     gg, ge, eg, ee = [], [], [], []
     for q in node.namespace["qubits"]:
+        # Bind the per-qubit traces once instead of re-selecting them for every statistic
+        ig_rot = ds_fit.Ig_rot.sel(qubit=q.name)
+        ie_rot = ds_fit.Ie_rot.sel(qubit=q.name)
         fit = minimize(
             _false_detections,
-            0.5 * (np.mean(ds_fit.Ig_rot.sel(qubit=q.name)) + np.mean(ds_fit.Ie_rot.sel(qubit=q.name))),
-            (ds_fit.Ig_rot.sel(qubit=q.name), ds_fit.Ie_rot.sel(qubit=q.name)),
+            0.5 * (np.mean(ig_rot) + np.mean(ie_rot)),
+            (ig_rot, ie_rot),
             method="Nelder-Mead",
         )
         threshold.append(fit.x[0])
-        gg.append(np.sum(ds_fit.Ig_rot.sel(qubit=q.name) < fit.x[0]) / len(ds_fit.Ig_rot.sel(qubit=q.name)))
-        ge.append(np.sum(ds_fit.Ig_rot.sel(qubit=q.name) > fit.x[0]) / len(ds_fit.Ig_rot.sel(qubit=q.name)))
-        eg.append(np.sum(ds_fit.Ie_rot.sel(qubit=q.name) < fit.x[0]) / len(ds_fit.Ie_rot.sel(qubit=q.name)))
-        ee.append(np.sum(ds_fit.Ie_rot.sel(qubit=q.name) > fit.x[0]) / len(ds_fit.Ie_rot.sel(qubit=q.name)))
-    ds_fit = ds_fit.assign({"ge_threshold": xr.DataArray(threshold, coords=dict(qubit=ds_fit.qubit.data))})
-    ds_fit = ds_fit.assign({"gg": xr.DataArray(gg, coords=dict(qubit=ds_fit.qubit.data))})
-    ds_fit = ds_fit.assign({"ge": xr.DataArray(ge, coords=dict(qubit=ds_fit.qubit.data))})
-    ds_fit = ds_fit.assign({"eg": xr.DataArray(eg, coords=dict(qubit=ds_fit.qubit.data))})
-    ds_fit = ds_fit.assign({"ee": xr.DataArray(ee, coords=dict(qubit=ds_fit.qubit.data))})
+        gg.append(np.sum(ig_rot < fit.x[0]) / len(ig_rot))
+        ge.append(np.sum(ig_rot > fit.x[0]) / len(ig_rot))
+        eg.append(np.sum(ie_rot < fit.x[0]) / len(ie_rot))
+        ee.append(np.sum(ie_rot > fit.x[0]) / len(ie_rot))
+    # Assign all derived variables in a single call since each assign copies the dataset
+    qubit_coord = dict(qubit=ds_fit.qubit.data)
     ds_fit = ds_fit.assign(
-        {"readout_fidelity": xr.DataArray(100 * (ds_fit.gg + ds_fit.ee) / 2, coords=dict(qubit=ds_fit.qubit.data))}
+        {
+            "ge_threshold": xr.DataArray(threshold, coords=qubit_coord),
+            "gg": xr.DataArray(gg, coords=qubit_coord),
+            "ge": xr.DataArray(ge, coords=qubit_coord),
+            "eg": xr.DataArray(eg, coords=qubit_coord),
+            "ee": xr.DataArray(ee, coords=qubit_coord),
+            "readout_fidelity": xr.DataArray(100 * (np.asarray(gg) + np.asarray(ee)) / 2, coords=qubit_coord),
+        }
     )
 
     # Extract the relevant fitted parameters
@@ -136,15 +136,21 @@ def _extract_relevant_fit_parameters(fit: xr.Dataset, node: QualibrationNode):
     success_criteria = freq_success & fwhm_success & saturation_amp_success
     fit = fit.assign({"success": success_criteria})
 
+    # Fetch all fitted per-qubit scalars in a single (variable, qubit) array
+    # instead of six labelled lookups per qubit
+    fitted_values = (
+        fit[["res_freq", "fwhm", "iw_angle", "saturation_amplitude", "x180_amplitude"]].to_array().values
+    )
+    success_values = fit.success.values
     fit_results = {
         q: FitParameters(
-            frequency=fit.sel(qubit=q).res_freq.values.__float__(),
-            fwhm=fit.sel(qubit=q).fwhm.values.__float__(),
-            iw_angle=fit.sel(qubit=q).iw_angle.values.__float__(),
-            saturation_amp=fit.sel(qubit=q).saturation_amplitude.values.__float__(),
-            x180_amp=fit.sel(qubit=q).x180_amplitude.values.__float__(),
-            success=fit.sel(qubit=q).success.values.__bool__(),
+            frequency=float(fitted_values[0, i]),
+            fwhm=float(fitted_values[1, i]),
+            iw_angle=float(fitted_values[2, i]),
+            saturation_amp=float(fitted_values[3, i]),
+            x180_amp=float(fitted_values[4, i]),
+            success=bool(success_values[i]),
         )
-        for q in fit.qubit.values
+        for i, q in enumerate(fit.qubit.values)
     }
     return fit, fit_results
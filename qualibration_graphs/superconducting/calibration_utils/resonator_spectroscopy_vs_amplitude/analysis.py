@@ -175,23 +175,29 @@ def _extract_and_validate_amplitude_parameters(
     fit = fit.assign_coords(res_freq=("qubit", res_freq.data))
     fit.res_freq.attrs = {"long_name": "resonator frequency", "units": "Hz"}
 
+    # Read the per-qubit scalars once instead of extracting them from
+    # zero-dimensional DataArrays inside the loop
+    res_freq_arr = np.asarray(fit.res_freq.values)
+    freq_shift_arr = np.asarray(fit.freq_shift.values)
+    optimal_power_arr = np.asarray(fit.optimal_power.values)
+
     # Evaluate outcomes and create results
     outcomes = []
     fit_results = {}
-    
+
     for i, qubit_name in enumerate(fit.qubit.values):
         # Extract parameters for outcome determination
         outcome_params = extract_amplitude_outcome_parameters(fit, qubit_name, node, ds_raw)
-        
+
         # Determine outcome
         outcome = determine_amplitude_outcome(outcome_params)
         outcomes.append(outcome)
-        
+
         # Create fit results
         fit_results[qubit_name] = FitParameters(
-            resonator_frequency=fit.sel(qubit=qubit_name).res_freq.values.item(),
-            frequency_shift=fit.sel(qubit=qubit_name).freq_shift.values.item(),
-            optimal_power=fit.sel(qubit=qubit_name).optimal_power.values.item(),
+            resonator_frequency=float(res_freq_arr[i]),
+            frequency_shift=float(freq_shift_arr[i]),
+            optimal_power=float(optimal_power_arr[i]),
             outcome=outcome,
         )
     
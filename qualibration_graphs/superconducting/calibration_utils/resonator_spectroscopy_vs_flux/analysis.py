@@ -21,6 +21,13 @@ from qualibrate import QualibrationNode
 qc_params = analysis_config_manager.get("resonator_spectroscopy_vs_flux_qc")
 sp_params = analysis_config_manager.get("common_signal_processing")
 
+# Outcome messages for qubits that fail the initial data-quality checks,
+# keyed by the code returned from evaluate_qubit_data_quality
+_FAILED_QUALITY_CHECK_MESSAGES = {
+    "no_peaks": "No peaks were detected, consider changing the frequency range",
+    "no_oscillations": "No oscillations were detected, consider checking that the flux line is connected or increase the flux range",
+}
+
 
 @dataclass
 class FitParameters:
@@ -107,19 +114,22 @@ def process_raw_dataset(ds: xr.Dataset, node: QualibrationNode) -> xr.Dataset:
     ds = ds.assign_coords(full_freq=(["qubit", "detuning"], full_freq))
     ds.full_freq.attrs = {"long_name": "RF frequency", "units": "Hz"}
     
-    # Add current axis for each qubit
+    # Add the current and attenuated current axes in a single assign_coords call,
+    # since each call shallow-copies the dataset
     current = ds.flux_bias / node.parameters.input_line_impedance_in_ohm
-    ds = ds.assign_coords({"current": (["flux_bias"], current.data)})
+    attenuation_factor = 10 ** (-node.parameters.line_attenuation_in_db / 20)
+    attenuated_current = current * attenuation_factor
+    ds = ds.assign_coords(
+        {
+            "current": (["flux_bias"], current.data),
+            "attenuated_current": (["flux_bias"], attenuated_current.data),
+        }
+    )
     ds.current.attrs["long_name"] = "Current"
     ds.current.attrs["units"] = "A"
-    
-    # Add attenuated current to dataset
-    attenuation_factor = 10 ** (-node.parameters.line_attenuation_in_db / 20)
-    attenuated_current = ds.current * attenuation_factor
-    ds = ds.assign_coords({"attenuated_current": (["flux_bias"], attenuated_current.values)})
     ds.attenuated_current.attrs["long_name"] = "Attenuated Current"
     ds.attenuated_current.attrs["units"] = "A"
-    
+
     return ds
 
 
@@ -204,12 +214,9 @@ def _extract_and_validate_flux_parameters(
         q = q_obj.name
 
         # Check if this qubit has fit results or failed initial quality checks
-        if q in qubit_outcomes and qubit_outcomes[q] in ["no_peaks", "no_oscillations"]:
+        if qubit_outcomes.get(q) in _FAILED_QUALITY_CHECK_MESSAGES:
             # This qubit failed initial quality checks
-            if qubit_outcomes[q] == "no_peaks":
-                outcome = "No peaks were detected, consider changing the frequency range"
-            else:
-                outcome = "No oscillations were detected, consider checking that the flux line is connected or increase the flux range"
+            outcome = _FAILED_QUALITY_CHECK_MESSAGES[qubit_outcomes[q]]
 
             # Create default FitParameters for failed qubit
             fit_results[q] = FitParameters(
@@ -258,7 +265,7 @@ def _extract_and_validate_flux_parameters(
         else:
             # This qubit doesn't have fit results but also wasn't marked as failed
             # This shouldn't happen, but handle gracefully
-            outcome = "No peaks were detected, consider changing the frequency range"
+            outcome = _FAILED_QUALITY_CHECK_MESSAGES["no_peaks"]
             fit_results[q] = FitParameters(
                 resonator_frequency=np.nan,
                 frequency_shift=np.nan,